@@ -0,0 +1,48 @@
+import gc
+import threading
+import unittest
+import weakref
+
+from thread_local import BaseContextManager, ContextVarsManager, LocalProxy
+
+
+class ManagerReleaseTest(unittest.TestCase):
+    """
+    Regression checks that managers and thread entries are not kept
+    alive by finalizers of local context objects and threads.
+    """
+
+    def test_dropped_manager_is_collected(self):
+        manager = BaseContextManager()
+        data = LocalProxy(manager)()
+        data.results = 99
+        manager_ref = weakref.ref(manager)
+
+        del manager, data
+        gc.collect()
+        self.assertIsNone(manager_ref())
+
+    def test_dropped_context_vars_manager_is_collected(self):
+        manager = ContextVarsManager()
+        data = LocalProxy(manager)()
+        data.results = 99
+        manager_ref = weakref.ref(manager)
+
+        del manager, data
+        gc.collect()
+        self.assertIsNone(manager_ref())
+
+    def test_dead_thread_entry_is_released(self):
+        manager = BaseContextManager()
+        data = LocalProxy(manager)()
+        data.results = 99
+
+        thread = threading.Thread(target=setattr, args=(data, 'results', 0))
+        thread.start()
+        thread.join()
+        self.assertNotIn(thread.ident, manager)
+        self.assertEqual(data.results, 99)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -107,14 +107,107 @@ example to add default arguments for local context objects:
     >>> print(data.color)
     red
 
+By default local context object attributes are accessed without any locking
+since each thread operates on it own attributes only. If access should be
+serialized anyway - create manager with thread_critical flag. Every local
+context object bound to such manager, ContextLocal subclasses included,
+gets it own lock:
+
+    >>> manager = BaseContextManager(thread_critical=True)
+    >>> data = LocalProxy(manager)()
+    >>> data.results = 99
+    >>> print(data.results)
+    99
+
 BaseContextManager could be subclassed too. Use-cases are:
 -   implementing read-only variables aka constants
 -   redesigning descriptors logic
 -   improve thread control functionality
 -   etc
 
+Note that local context object binds manager get(), set() and delete()
+methods once on creation. Override them in manager class; methods replaced
+on manager instance afterwards are not seen by already created objects.
+
+ContextVarsManager is such subclass. It keeps attributes in PEP 567 context
+variable instead of thread id keyed dictionary, so local context object
+attributes are separated between asyncio tasks as well as between threads:
+
+    >>> import asyncio
+    >>> manager = ContextVarsManager()
+    >>> data = LocalProxy(manager)()
+    >>> data.value = 'main'
+
+    >>> async def task(n):
+    ...     data.value = n
+    ...     await asyncio.sleep(0)
+    ...     return data.value
+    ...
+    >>> async def main():
+    ...     return await asyncio.gather(*(task(n) for n in range(3)))
+    ...
+    >>> print(asyncio.run(main()))
+    [0, 1, 2]
+    >>> print(data.value)
+    main
+
 """
-from threading import RLock, get_ident
+from contextvars import ContextVar
+from functools import partial
+from threading import RLock, get_ident, local
+from types import MappingProxyType
+from weakref import finalize, ref
+
+# module level alias spares attribute lookup on builtin object
+# in every access descriptor call
+_getattribute = object.__getattribute__
+
+# marker of absent value where None is valid one
+_MISSING = object()
+
+# single context variable shared by all ContextVarsManager instances.
+# It maps weak reference of manager to attributes dictionary, so context
+# keeps neither dropped manager nor context variable per manager alive
+_context_attrs = ContextVar('thread_local_attrs', default=MappingProxyType({}))
+
+
+class _ThreadGuard(object):
+    """
+    Marker stored in thread local storage of registered thread.
+    It is collected together with thread local storage when thread
+    dies, so it's finalizer releases thread entry in manager.
+    """
+
+    __slots__ = ('__weakref__',)
+
+
+def _release_thread(manager_ref, id):
+    """
+    Finalizer callback of thread guard. Manager is referenced weakly,
+    otherwise finalizers registry would keep manager alive for the
+    whole life of registered thread.
+
+    :param manager_ref: weakref to BaseContextManager
+    :param id: int
+    :return: None
+    """
+    manager = manager_ref()
+    if manager is not None:
+        manager._unregister_id(id)
+
+
+def _context_dict(manager_ref):
+    """
+    Return attributes of ContextVarsManager in current context without
+    special ones. Stored in attributes dictionary instead of bound method,
+    which would keep manager alive as long as context.
+
+    :param manager_ref: weakref to ContextVarsManager
+    :return: dict or None
+    """
+    attrs = _context_attrs.get().get(manager_ref)
+    if attrs is not None:
+        return {k: v for k, v in attrs.items() if not k.startswith('__')}
 
 
 class ContextLocal(object):
@@ -124,11 +217,29 @@ class ContextLocal(object):
     thread within the context of which this variable was assigned.
     """
 
+    # special attributes are stored in slots under constant names so
+    # access descriptors could fetch them with a single lookup. Thread
+    # attributes themselves are kept by manager only
+    __slots__ = ('__getter_ref__', '__setter_ref__', '__deleter_ref__',
+                 '__largs_ref__', '__lock_ref__', '__weakref__')
+
+    # whether class implements own __init__, computed once per class
+    _custom_init = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._custom_init = cls.__init__ is not object.__init__
+
     def __new__(cls, manager: object, *args, **kwargs):
         """
         This method run before class instantiated to bind each new instance
         with context manager and store special meta attributes.
 
+        Manager should provide ident_func, register(), get(), set() and
+        delete(). Optional thread_critical flag enables instance lock and
+        optional tracks_threads flag makes thread entry to be released
+        once instance is garbage collected.
+
         :param manager: BaseContextManager
         :param args: object, *
         :param kwargs: **
@@ -138,50 +249,65 @@ class ContextLocal(object):
         # case: since Py 2.5 object __init__ method accept no arguments
         # this check should prevent creating instance with init arguments
         # but without own __init__ method implementation
-        if (args or kwargs) and (cls.__init__ is object.__init__):
+        if (args or kwargs) and not cls._custom_init:
             raise TypeError("Initialization arguments are not supported")
 
         self = super().__new__(cls)
-        id = manager.ident_func()
-        name = cls.__name__
 
-        object.__setattr__(self, '_{}__manager'.format(name), manager)
-        object.__setattr__(self, '_{}__largs'.format(name), (args, kwargs))
-        object.__setattr__(self, '_{}__lock'.format(name), RLock())
-        object.__setattr__(self, '__name__', name)
-
-        attrs_dict = object.__getattribute__(self, '__dict__')
-        manager.register(attrs_dict, id)
+        # manager is fixed for object lifetime, so access descriptors
+        # are bound once instead of being looked up on every access
+        object.__setattr__(self, '__getter_ref__', manager.get)
+        object.__setattr__(self, '__setter_ref__', manager.set)
+        object.__setattr__(self, '__deleter_ref__', manager.delete)
+        object.__setattr__(self, '__largs_ref__', (args, kwargs))
+        # case: thread critical manager requires every access to be
+        # serialized, other objects get no lock at all
+        lock = RLock() if getattr(manager, 'thread_critical', False) else None
+        object.__setattr__(self, '__lock_ref__', lock)
+
+        # thread entry is released once object is garbage collected.
+        # Finalizer gets id of owner thread, not of the collecting one.
+        # Managers without per thread entries need neither of them
+        attrs = {'__name__': cls.__name__}
+        if getattr(manager, 'tracks_threads', False):
+            id = manager.ident_func()
+            manager.register(attrs, id)
+            finalize(self, manager._unregister_id, id, attrs)
+        else:
+            manager.register(attrs)
         return self
 
     def __getattribute__(self, name):
-        cls_name = object.__getattribute__(self, '__name__')
-        lock = object.__getattribute__(self, '_{}__lock'.format(cls_name))
-        with lock:
-            manager = object.__getattribute__(self, '_{}__manager'.format(cls_name))
-            return manager.get(name)
+        lock = _getattribute(self, '__lock_ref__')
+        if lock is None:
+            return _getattribute(self, '__getter_ref__')(name)
+        lock.acquire()
+        try:
+            return _getattribute(self, '__getter_ref__')(name)
+        finally:
+            lock.release()
 
     def __setattr__(self, name, value):
-        cls_name = object.__getattribute__(self, '__name__')
-        lock = object.__getattribute__(self, '_{}__lock'.format(cls_name))
-        with lock:
-            manager = object.__getattribute__(self, '_{}__manager'.format(cls_name))
-            manager.set(self, name, value)
+        lock = _getattribute(self, '__lock_ref__')
+        if lock is None:
+            _getattribute(self, '__setter_ref__')(self, name, value)
+            return
+        lock.acquire()
+        try:
+            _getattribute(self, '__setter_ref__')(self, name, value)
+        finally:
+            lock.release()
 
     def __delattr__(self, name):
-        cls_name = object.__getattribute__(self, '__name__')
-        lock = object.__getattribute__(self, '_{}__lock'.format(cls_name))
-        with lock:
-            manager = object.__getattribute__(self, '_{}__manager'.format(cls_name))
-            manager.delete(name)
-
-    def __del__(self):
-        cls_name = object.__getattribute__(self, '__name__')
-        lock = object.__getattribute__(self, '_{}__lock'.format(cls_name))
-        with lock:
-            manager = object.__getattribute__(self, '_{}__manager'.format(cls_name))
-            if self in manager:
-                manager.unregister()
+        lock = _getattribute(self, '__lock_ref__')
+        if lock is None:
+            _getattribute(self, '__deleter_ref__')(name)
+            return
+        lock.acquire()
+        try:
+            _getattribute(self, '__deleter_ref__')(name)
+        finally:
+            lock.release()
 
 
 class LocalProxy():
@@ -190,6 +316,8 @@ class LocalProxy():
     and LocalContext object
     """
 
+    __slots__ = ('manager',)
+
     def __init__(self, manager):
         """
         Manager argument will be used to instantiate ContextLocal
@@ -210,8 +338,9 @@ class LocalProxy():
         :param kwargs: **
         :return: ContextLocal
         """
-        if self.manager:
-            return ContextLocal(self.manager, *args, **kwargs)
+        manager = self.manager
+        if manager:
+            return ContextLocal(manager, *args, **kwargs)
         raise AttributeError('No manager provided to manage local object')
 
 
@@ -224,20 +353,45 @@ class BaseContextManager(object):
     E.g it proxies calls to appropriate objects from different contexts(threads).
     """
 
+    # kept for compatibility only: special attributes of local context
+    # objects live in ContextLocal slots and never get into attributes
+    # dictionaries, so manager no longer filters them out
     SPECIAL_METHODS = ['manager', 'largs', 'lock']
 
-    def __init__(self, ident_fn=None):
+    READ_ONLY = frozenset(['__dict__', '__name__'])
+
+    # attributes are stored per thread id, so local context objects
+    # release entry of their owner thread once garbage collected
+    tracks_threads = True
+
+    def __init__(self, ident_fn=None, *, thread_critical=False):
         """
         Initialize ContextManager with identification function. It used
         to identify thread which want to get/set/del attributes of local
         context object.
         Leave None to use threading get_ident() implementation.
 
+        Set thread_critical to serialize each access to local context
+        objects bound to this manager with instance lock.
+
         :param ident_fn: function or None
+        :param thread_critical: bool
         """
         self.objects = {}
-        self.ident_func = ident_fn if ident_fn else self._get_ident()
+        self.ident_func = ident_fn or get_ident
+        self.thread_critical = thread_critical
+        # guards structural changes of objects dictionary only, single key
+        # get/set/del are atomic for lock-free readers. Lock has to be
+        # reentrant: garbage collection triggered inside locked section
+        # may run finalizer of local object bound to this manager.
+        # Single lock is not sharded per thread id: threads take it only
+        # on register/unregister, once per thread lifetime, while hot path
+        # reads thread local cache without any lock
         self.lock = RLock()
+        # per thread cache of objects dictionary entries
+        self._thr = local()
+        # per thread guards releasing entries of dead threads
+        self._guards = local()
 
     def __contains__(self, item):
         """
@@ -248,10 +402,10 @@ class BaseContextManager(object):
         """
 
         # TODO: replace specific class check with abstract class check
-        if isinstance(item, (ContextLocal,)):
+        if isinstance(item, ContextLocal):
             item = self.ident_func()
 
-        return item in self.objects.keys()
+        return item in self.objects
 
     def register(self, attrs: dict, id=None):
         """
@@ -274,6 +428,15 @@ class BaseContextManager(object):
 
         with self.lock:
             self.objects[id] = attrs
+            self._refresh(id, attrs)
+
+        # case: entry of registered OS thread is bound to thread lifetime,
+        # single guard per thread releases whatever entry thread has
+        if (self.ident_func is get_ident and id == get_ident()
+                and getattr(self._guards, 'guard', None) is None):
+            guard = _ThreadGuard()
+            finalize(guard, _release_thread, ref(self), id)
+            self._guards.guard = guard
 
     def unregister(self, id=None):
         """
@@ -281,20 +444,59 @@ class BaseContextManager(object):
         by garbage collector e.g when thread-owner of this object
         was deleted.
 
-        :param id: str, int
+        :param id: int
         :return: None
         """
 
         id = id if id else self.ident_func()
-        if isinstance(id, (str,)):
-            id = int(id)
-        assert isinstance(id, (int,)), '[id] should be of int type'
+        with self.lock:
+            try:
+                del self.objects[id]
+            except KeyError:
+                raise AttributeError('Unable to find object with id {0}'.format(id)) from None
+            self._refresh(id, None)
 
-        if id in self:
-            with self.lock:
+    def _unregister_id(self, id, attrs=None):
+        """
+        Finalizer callback of local context object and of thread guard.
+        Unregister thread with id only if it is still bound to attributes
+        dictionary registered for finalized object, so threads re-registered
+        by other local context object are left untouched.
+        Leave attrs None to release any entry of dead thread.
+
+        :param id: int
+        :param attrs: dict or None
+        :return: None
+        """
+        with self.lock:
+            current = self.objects.get(id)
+            if current is not None and (attrs is None or current is attrs):
                 del self.objects[id]
+                # case: finalizer may run in any thread, even in dying one,
+                # so cached entries of all threads are dropped
+                self._thr = local()
+
+    def _refresh(self, id, attrs):
+        """
+        Bring thread local cache in line with changed entry of thread
+        with id. Own cache of caller thread is updated in place; caches
+        of other threads are unreachable, so all of them are dropped and
+        threads will look entries up again.
+        Should be called with manager lock held.
+
+        :param id: int
+        :param attrs: dict or None if thread was unregistered
+        :return: None
+        """
+        if self.ident_func is not get_ident:
             return
-        raise AttributeError('Unable to find object with id {0}'.format(id))
+
+        if id != get_ident():
+            self._thr = local()
+        elif attrs is None:
+            self._thr.__dict__.pop('attrs', None)
+        else:
+            self._thr.attrs = attrs
 
     def get(self, name: str):
         """
@@ -307,11 +509,13 @@ class BaseContextManager(object):
         :param name: str
         :return: any
         """
-        id = self.ident_func()
-        if id in self:
-            attrs = self.objects[id]
-            return attrs.get(name)
-        raise AttributeError ('No local context object found for process with id {0}'.format(id))
+        attrs = getattr(self._thr, 'attrs', None)
+        if attrs is None:
+            id = self.ident_func()
+            attrs = self._lookup(id)
+            if attrs is None:
+                raise AttributeError ('No local context object found for process with id {0}'.format(id))
+        return attrs.get(name)
 
     def set(self, obj, name, value):
         """
@@ -323,8 +527,8 @@ class BaseContextManager(object):
         context object value - set() will automatically register such
         thread using register() method.
 
-        Object which call this method need to patch it's own __dict__
-        which leads to the need of 'obj' argument; also it needed
+        Object which call this method is needed to replay it's
+        __init__ for newly registered thread; also it needed
         to restrict access to __dict__ and __name__ attributes.
 
         :param obj:
@@ -332,32 +536,26 @@ class BaseContextManager(object):
         :param value:
         :return: None
         """
-        id = self.ident_func()
-
-        if name == '__dict__' or name == '__name__':
+        if name in self.READ_ONLY:
             raise AttributeError('{} object attribute {} is read-only'.format(type(obj).__name__, name))
 
-        if id in self:
-            attrs = self.objects[id]
+        attrs = getattr(self._thr, 'attrs', None)
+        if attrs is None:
+            id = self.ident_func()
+            attrs = self._lookup(id)
+
+        if attrs is not None:
             attrs[name] = value
         else:
-            attrs = dict()
-            attrs[name] = value
-
-            old_attrs = object.__getattribute__(obj, '__dict__')
-            for k in self._get_snames(obj):
-                attrs[k] = old_attrs[k]
+            cls = type(obj)
+            attrs = {name: value, '__name__': cls.__name__}
 
             self.register(attrs, id)
+            finalize(obj, self._unregister_id, id, attrs)
 
-            # special attributes patch
-            object.__setattr__(obj, '__dict__', attrs)
-            object.__setattr__(obj, '__name__', type(obj).__name__)
-
-            cls = type(obj)
-            if cls.__init__ is not object.__init__:
-                args, kwargs = object.__getattribute__(obj, '_{}__largs'.format(type(obj).__name__))
-                cls.__init__(obj, self, *args, **kwargs)
+            # __init__ replay runs after register() released the lock
+            if cls._custom_init:
+                self._replay_init(obj)
 
     def delete(self, name: str):
         """
@@ -368,58 +566,200 @@ class BaseContextManager(object):
         :param name: str
         :return: None
         """
-        id = self.ident_func()
-        if id in self:
-            attrs = self.objects[id]
-            if name in attrs.keys() and (name != '__name__' and name != '__dict__'):
-                with self.lock:
-                    del attrs[name]
-                    return
+        attrs = getattr(self._thr, 'attrs', None)
+        if attrs is None:
+            attrs = self._lookup(self.ident_func())
+
+        if attrs is not None and name not in self.READ_ONLY:
+            # no lock needed: attrs dict is touched only by owner thread
+            if attrs.pop(name, _MISSING) is not _MISSING:
+                return
         raise KeyError('{}'.format(name))
 
-    def _get_ident(self):
+    def _replay_init(self, obj):
         """
-        Return method to identify current (caller) thread.
+        Run __init__ of local context object for newly registered
+        thread with arguments object was created with. It's replayed
+        even without arguments since __init__ may set thread defaults.
 
-        :return: function
+        :param obj: ContextLocal
+        :return: None
+        """
+        args, kwargs = _getattribute(obj, '__largs_ref__')
+        type(obj).__init__(obj, self, *args, **kwargs)
+
+    def _lookup(self, id):
+        """
+        Find attributes dictionary of current thread by it's id in objects
+        dictionary. Found entry is cached in thread local storage
+        so next access skips thread identification and lookup.
+        Cache is used only with threading get_ident() identification
+        since other ident functions may not map to OS threads.
+
+        :param id: int
+        :return: dict or None
         """
-        return get_ident
+        # case: cache is taken before lookup so concurrent register/unregister
+        # replacing it leaves stale entry in dropped cache only
+        thr = self._thr
+        attrs = self.objects.get(id)
+        if attrs is not None and self.ident_func is get_ident:
+            thr.attrs = attrs
+        return attrs
 
     def _get_dict(self):
         """
         This method filter context object __dict__ attribute
-        by removing special methods.
+        by removing special attributes.
         It's needed to make thread retrieve only useful attributes
         without local context implementation helpers
 
         :return: dict
         """
-        id = self.ident_func()
+        attrs = getattr(self._thr, 'attrs', None)
+        if attrs is None:
+            attrs = self._lookup(self.ident_func())
 
-        if id in self:
-            attrs = self.objects[id]
-            try:
-                name = attrs['__name__']
-            except KeyError:
-                raise AttributeError('Unable to retrieve class name') from None
-            special_methods = self._get_snames(name)
-            return {k: v for k, v in
-                    filter(lambda item: item if item[0] not in special_methods
-                                                and not item[0].startswith('__') else None, attrs.items())}
+        if attrs is not None:
+            return {k: v for k, v in attrs.items() if not k.startswith('__')}
 
-    def _get_snames(self, obj: object):
+
+class ContextVarsManager(BaseContextManager):
+    """
+    This class manages local context objects attributes stored in
+    context variable (PEP 567) instead of objects dictionary.
+    Each thread and each asyncio task gets it own attributes without
+    thread identification at all.
+
+    Context is copied on asyncio task creation, so attributes dictionary
+    is never changed in place: every write stores updated copy in
+    context variable and leaves parent context untouched.
+
+    Thread identification and objects dictionary are left unused.
+    """
+
+    # attributes are released together with context itself, so local
+    # context objects need no finalizer
+    tracks_threads = False
+
+    def __init__(self, *, thread_critical=False):
+        """
+        Initialize ContextVarsManager. Manager is keyed by weak reference
+        in shared context variable.
+
+        :param thread_critical: bool
+        """
+        super().__init__(thread_critical=thread_critical)
+        self._key = ref(self)
+
+    def __contains__(self, item):
+        """
+        Check if current context is managed by ContextVarsManager.
+        Thread ids are not tracked, so only local context objects
+        could be checked.
+
+        :param item: ContextLocal
+        :return: bool
+        """
+        if isinstance(item, ContextLocal):
+            return self._key in _context_attrs.get()
+        return False
+
+    def register(self, attrs: dict, id=None):
+        """
+        Bind attributes dictionary to current context.
+
+        :param attrs: dict
+        :param id: ignored, left for compatibility
+        :return: None
+        """
+        attrs['__dict__'] = partial(_context_dict, self._key)
+        self._store(attrs)
+
+    def unregister(self, id=None):
+        """
+        Unbind attributes dictionary from current context.
+
+        :param id: ignored, left for compatibility
+        :return: None
+        """
+        if self._key not in _context_attrs.get():
+            raise AttributeError('Unable to find object for current context')
+        self._store(None)
+
+    def get(self, name: str):
+        """
+        This method is a read access descriptor.
+
+        :param name: str
+        :return: any
+        """
+        attrs = _context_attrs.get().get(self._key)
+        if attrs is None:
+            raise AttributeError('No local context object found for current context')
+        return attrs.get(name)
+
+    def set(self, obj, name, value):
         """
-        This method builds the list of special object attributes
+        This method is a write access descriptor.
+        Unregistered context is registered automatically just like
+        BaseContextManager.set() does for threads.
 
-        :param obj: str or instance
-        :return: list
+        :param obj:
+        :param name:
+        :param value:
+        :return: None
         """
-        if isinstance(obj, (str,)):
-            name = obj
+        if name in self.READ_ONLY:
+            raise AttributeError('{} object attribute {} is read-only'.format(type(obj).__name__, name))
+
+        attrs = _context_attrs.get().get(self._key)
+        if attrs is not None:
+            attrs = attrs.copy()
+            attrs[name] = value
+            self._store(attrs)
         else:
-            try:
-                cls = object.__getattribute__(obj, '__class__')
-                name = cls.__name__
-            except:
-                raise TypeError('Object is neither instance nor string. Cannot obtain __name__')
-        return ['_{}__{}'.format(name, method) for method in self.SPECIAL_METHODS]
\ No newline at end of file
+            cls = type(obj)
+            self.register({name: value, '__name__': cls.__name__})
+
+            if cls._custom_init:
+                self._replay_init(obj)
+
+    def delete(self, name: str):
+        """
+        This method is delete access descriptor.
+
+        :param name: str
+        :return: None
+        """
+        attrs = _context_attrs.get().get(self._key)
+        if attrs is not None and name in attrs and name not in self.READ_ONLY:
+            attrs = attrs.copy()
+            del attrs[name]
+            self._store(attrs)
+            return
+        raise KeyError('{}'.format(name))
+
+    def _store(self, attrs):
+        """
+        Store attributes dictionary of current context, None removes it.
+        Mapping of shared context variable is copied as well, entries of
+        collected managers are dropped on the way.
+
+        :param attrs: dict or None
+        :return: None
+        """
+        mapping = {k: v for k, v in _context_attrs.get().items() if k() is not None}
+        if attrs is None:
+            mapping.pop(self._key, None)
+        else:
+            mapping[self._key] = attrs
+        _context_attrs.set(mapping)
+
+    def _get_dict(self):
+        """
+        Return attributes of current context without special ones.
+
+        :return: dict
+        """
+        return _context_dict(self._key)
\ No newline at end of file